@@ -5,7 +5,11 @@ imagesフォルダからランダムに画像を選択する機能を提供
 
 import os
 import random
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
 
 
 class DatasetLoader:
@@ -21,6 +25,13 @@ class DatasetLoader:
         self.images_dir = images_dir
         self.supported_formats = {".png", ".jpg", ".jpeg", ".bmp", ".gif"}
         self.image_files = []
+        self._n = 0  # 画像数のキャッシュ（ランダム選択のたびのlen()を省く）
+        self._cat_file_lists = []  # カテゴリごとのファイルリスト（均等出題用）
+        self._dir_mtime = None  # フォルダのmtime（キャッシュ無効化の判定用）
+        self._categories = None  # カテゴリ分類のキャッシュ
+        self._all_images = None  # get_all_images用の不変タプルのキャッシュ
+        self._pool = None  # 先読みデコード用のスレッドプール（初回利用時に生成）
+        self._prefetch = {}  # {画像パス: デコード結果のFuture}
         self.load_image_list()
 
     def load_image_list(self):
@@ -29,12 +40,43 @@ class DatasetLoader:
             os.makedirs(self.images_dir, exist_ok=True)
             return
 
-        self.image_files = [
-            os.path.join(self.images_dir, f)
-            for f in os.listdir(self.images_dir)
-            if os.path.isfile(os.path.join(self.images_dir, f))
-            and Path(f).suffix.lower() in self.supported_formats
-        ]
+        # フォルダが変更されていなければ再スキャンしない
+        mtime = os.stat(self.images_dir).st_mtime_ns
+        if mtime == self._dir_mtime and self.image_files:
+            return
+
+        # os.scandirはreaddirの結果をキャッシュしたDirEntryを返すため、
+        # ファイルごとのstat呼び出しとパス結合を省略できる
+        image_files = []
+        names = []
+
+        with os.scandir(self.images_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (
+                    entry.is_file()
+                    and name[name.rfind(".") :].lower() in self.supported_formats
+                ):
+                    image_files.append(entry.path)
+                    names.append(name)
+
+        # カテゴリ名の抽出はnumpyの文字列演算で一括処理する
+        # （Pythonレベルのsplit/lowerをファイルごとに呼ぶより大規模データセットで速い）
+        # partitionは区切り文字以降を走査しないためsplitより軽い
+        categories = defaultdict(list)
+        if names:
+            name_arr = np.char.partition(
+                np.char.partition(np.array(names), "_")[:, 0], "-"
+            )[:, 0]
+            for category, path in zip(np.char.lower(name_arr).tolist(), image_files):
+                categories[category].append(path)
+
+        self.image_files = image_files
+        self._n = len(image_files)
+        self._categories = categories
+        self._cat_file_lists = list(categories.values())
+        self._all_images = None  # リストが変わったのでタプルキャッシュも無効化
+        self._dir_mtime = mtime
 
     def get_random_image(self):
         """
@@ -43,19 +85,84 @@ class DatasetLoader:
         Returns:
             画像ファイルのパス。画像がない場合はNone
         """
-        if not self.image_files:
+        if not self._n:
             return None
 
-        return random.choice(self.image_files)
+        return self.image_files[random.randrange(self._n)]
+
+    def get_random_image_balanced(self):
+        """
+        カテゴリ間で出題機会が均等になるようにランダムに画像を1枚選択
+
+        まずカテゴリを等確率で選び、その中からファイルを選ぶため、
+        枚数の多いカテゴリに出題が偏らない
+
+        Returns:
+            画像ファイルのパス。画像がない場合はNone
+        """
+        if not self._cat_file_lists:
+            return None
+
+        files = self._cat_file_lists[random.randrange(len(self._cat_file_lists))]
+        return files[random.randrange(len(files))]
+
+    def prefetch(self, n=4):
+        """
+        次の問題の候補画像をバックグラウンドでデコードしておく
+
+        現在の問題をプレイしている間にディスク読み込みとJPEGデコードを
+        済ませることで、次の問題開始時の待ち時間をなくす
+
+        Args:
+            n: 先読みしておく画像の枚数
+        """
+        if not self.image_files:
+            return
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=2)
+
+        candidates = random.sample(
+            self.image_files, min(n, len(self.image_files))
+        )
+        for path in candidates:
+            if path not in self._prefetch:
+                self._prefetch[path] = self._pool.submit(cv2.imread, path)
+
+    def get_random_prepared_image(self):
+        """
+        先読み済みのデコード画像をランダムに1枚取り出す
+
+        先読みが空の場合はその場で補充してから取り出す。
+        取り出し後は次の問題に備えてキューを補充する
+
+        Returns:
+            (画像パス, デコード済み画像) のタプル。画像がない場合は(None, None)
+        """
+        if not self._prefetch:
+            self.prefetch()
+        if not self._prefetch:
+            return None, None
+
+        path = random.choice(list(self._prefetch))
+        image = self._prefetch.pop(path).result()
+
+        # 次の問題のためにキューを補充しておく
+        self.prefetch()
+
+        return path, image
 
     def get_all_images(self):
         """
         すべての画像ファイルのリストを取得
 
         Returns:
-            画像ファイルパスのリスト
+            画像ファイルパスのタプル（読み取り専用）
         """
-        return self.image_files.copy()
+        # 防御的コピーの代わりに不変なタプルをキャッシュして返す
+        if self._all_images is None:
+            self._all_images = tuple(self.image_files)
+        return self._all_images
 
     def get_image_count(self):
         """画像の総数を取得"""
@@ -68,19 +175,18 @@ class DatasetLoader:
         Returns:
             {カテゴリ名: [画像パスのリスト]} の辞書
         """
-        categories = {}
-
-        for image_path in self.image_files:
-            filename = os.path.basename(image_path)
-            # ファイル名の最初の部分をカテゴリ名とする
-            category = filename.split("_")[0].split("-")[0].lower()
+        # 分類はload_image_listのスキャン時に構築済み
+        if self._categories is None:
+            return {}
+        return dict(self._categories)
 
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(image_path)
-
-        return categories
+    def refresh(self, force=False):
+        """
+        画像リストを再読み込み
 
-    def refresh(self):
-        """画像リストを再読み込み"""
+        Args:
+            force: Trueの場合はmtimeキャッシュを無視して必ず再スキャンする
+        """
+        if force:
+            self._dir_mtime = None
         self.load_image_list()
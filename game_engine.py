@@ -6,6 +6,7 @@ GameEngine - ゲームロジック管理クラス
 import cv2
 import os
 import json  # 追加: JSON読み込み用
+from collections import OrderedDict
 import numpy as np
 from image_processor import ImageProcessor
 
@@ -13,9 +14,13 @@ from image_processor import ImageProcessor
 class GameEngine:
     """ゲームエンジンクラス"""
 
-    def __init__(self, image_path, mode="blur", time_limit=30.0):
+    def __init__(self, image_path, mode="blur", time_limit=30.0, preloaded_image=None):
         """
         初期化
+
+        Args:
+            preloaded_image: デコード済みのBGR画像。指定された場合は
+                ファイルの読み込み（load_image）をスキップする
         """
         self.image_path = image_path
         self.mode = mode
@@ -24,21 +29,47 @@ class GameEngine:
         self.original_image = None
         self.correct_answer_key = ""  # 変数名を変更 (keyとして扱うため)
         self.synonyms = {}  # 追加: 類義語辞書
+        self._valid_answers = {}  # キーごとの正規化済み正解セット（回答判定用）
 
         self.image_processor = ImageProcessor()
-        
+
+        # 処理済みフレームのキャッシュ（LRU）
+        # 進行度を量子化して同じ見た目のフレームの再計算を避ける
+        self._frame_cache = OrderedDict()
+        self._cache_cap = 32
+
+        # 縮小前の元解像度画像（表示用に縮小した場合のみ保持）
+        self._full_res = None
+
+
         # 追加: 類義語辞書の読み込み
         self.load_synonyms()
 
         # 1. 正解キーワードの抽出
         self.extract_answer_from_filename()
 
-        # 2. 画像の読み込み
-        self.load_image()
+        # 2. 画像の読み込み（先読み済みならデコードをスキップ）
+        if preloaded_image is not None:
+            self.original_image = preloaded_image
+        else:
+            self.load_image()
 
         # 3. OpenCVによる主要被写体の検出とクロップ
         self.crop_to_main_subject()
 
+        # 4. 表示用サイズへの縮小（以降の画像処理コストを削減）
+        self.downscale_for_display()
+
+    @classmethod
+    def from_preloaded(cls, image, image_path, mode="blur", time_limit=30.0):
+        """
+        デコード済み画像からGameEngineを生成する
+
+        DatasetLoaderの先読みキューから取り出した画像を使うことで、
+        問題開始時のディスク読み込み・JPEGデコードを省略できる
+        """
+        return cls(image_path, mode, time_limit, preloaded_image=image)
+
     def load_synonyms(self):  # 追加: 辞書読み込みメソッド
         """類義語辞書(synonyms.json)を読み込む"""
         json_path = os.path.join(os.path.dirname(__file__), "synonyms.json")
@@ -52,14 +83,37 @@ class GameEngine:
         else:
             self.synonyms = {}
 
+        # 正規化（小文字化・空白除去）済みの正解セットを読み込み時に1回だけ構築し、
+        # check_answerの呼び出しごとの再構築をなくす
+        self._valid_answers = {
+            key: frozenset(
+                [key.lower()] + [str(s).strip().lower() for s in syns]
+            )
+            for key, syns in self.synonyms.items()
+        }
+
     def load_image(self):
         """画像を読み込む"""
         if os.path.exists(self.image_path):
-            self.original_image = cv2.imread(self.image_path)
+            # 大きなJPEGは1/2サイズでデコードする
+            # （libjpeg-turboのIDCTスケーリングにより、フル解像度でデコードして
+            # から縮小するより大幅に速い。どのみちdownscale_for_displayで
+            # 表示サイズまで縮小されるため解像度の損失は実質ない）
+            flags = cv2.IMREAD_COLOR
+            ext = os.path.splitext(self.image_path)[1].lower()
+            if (
+                ext in (".jpg", ".jpeg")
+                and os.path.getsize(self.image_path) > 1024 * 1024
+            ):
+                flags = cv2.IMREAD_REDUCED_COLOR_2
+
+            self.original_image = cv2.imread(self.image_path, flags)
             if self.original_image is None:
                 raise ValueError(f"画像の読み込みに失敗しました: {self.image_path}")
-            # BGRからRGBに変換
-            self.original_image = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2RGB)
+            # OpenCVネイティブのBGRのまま保持する
+            # （ぼかし・ズーム処理はチャンネル順に依存しないため、
+            # RGBへの変換は表示直前に1回だけ行えばよい）
+            self._frame_cache.clear()
         else:
             raise FileNotFoundError(f"画像ファイルが見つかりません: {self.image_path}")
 
@@ -83,8 +137,23 @@ class GameEngine:
 
         h, w = self.original_image.shape[:2]
 
+        # 0. 検出はサムネイルで行う（結果はバウンディングボックスだけなので
+        # フル解像度で重いフィルタ群を回す必要がない）。長辺512px以下に縮小し、
+        # 最後に座標を元のスケールへ戻す
+        detect_scale = 1.0
+        detect_image = self.original_image
+        if max(h, w) > 512:
+            detect_scale = 512.0 / max(h, w)
+            detect_image = cv2.resize(
+                self.original_image,
+                None,
+                fx=detect_scale,
+                fy=detect_scale,
+                interpolation=cv2.INTER_AREA,
+            )
+
         # 1. 前処理：グレースケール化とぼかし
-        gray = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2GRAY)
+        gray = cv2.cvtColor(detect_image, cv2.COLOR_BGR2GRAY)
         # ノイズを消すため、ぼかしを少し強めに(9x9)
         blurred = cv2.GaussianBlur(gray, (9, 9), 0)
 
@@ -97,45 +166,56 @@ class GameEngine:
         kernel = np.ones((7, 7), np.uint8)
         dilated = cv2.dilate(edges, kernel, iterations=4)
 
-        # 4. 輪郭の抽出
-        contours, _ = cv2.findContours(
-            dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
+        # 4. 連結成分の抽出
+        # findContours + 輪郭ごとのboundingRectの代わりに
+        # connectedComponentsWithStatsで矩形と面積を1回のC呼び出しで取得する
+        num_labels, _, stats, _ = cv2.connectedComponentsWithStats(dilated)
 
-        if not contours:
+        if num_labels <= 1:  # ラベル0は背景
             return
 
-        # 5. 有効な輪郭をすべて集める
-        valid_rects = []
-        image_area = w * h
+        # 5. 有効な成分をすべて集める（座標はサムネイル基準）
+        dh, dw = detect_image.shape[:2]
+        image_area = dw * dh
 
-        for contour in contours:
-            x, y, cw, ch = cv2.boundingRect(contour)
-            area = cw * ch
+        # 画像全体の0.5%以上の面積（外接矩形ベース）を持つものは「被写体の一部」とみなす
+        # 小さすぎるゴミ（ノイズ）だけ除外
+        stats = stats[1:]  # 背景ラベルを除く
+        valid_rects = stats[
+            stats[:, cv2.CC_STAT_WIDTH] * stats[:, cv2.CC_STAT_HEIGHT]
+            > image_area * 0.005
+        ]
 
-            # 画像全体の0.5%以上の面積を持つものは「被写体の一部」とみなす
-            # 小さすぎるゴミ（ノイズ）だけ除外
-            if area > (image_area * 0.005):
-                valid_rects.append((x, y, x + cw, y + ch))
-
-        if not valid_rects:
+        if len(valid_rects) == 0:
             return
 
-        # 6. すべての有効な輪郭を囲む「大きな外枠」を計算
+        # 6. すべての有効な成分を囲む「大きな外枠」を計算
         # min_x, min_y は最小値、max_x, max_y は最大値を取ることで全体を包含
-        min_x = min([r[0] for r in valid_rects])
-        min_y = min([r[1] for r in valid_rects])
-        max_x = max([r[2] for r in valid_rects])
-        max_y = max([r[3] for r in valid_rects])
+        min_x = valid_rects[:, cv2.CC_STAT_LEFT].min()
+        min_y = valid_rects[:, cv2.CC_STAT_TOP].min()
+        max_x = (
+            valid_rects[:, cv2.CC_STAT_LEFT] + valid_rects[:, cv2.CC_STAT_WIDTH]
+        ).max()
+        max_y = (
+            valid_rects[:, cv2.CC_STAT_TOP] + valid_rects[:, cv2.CC_STAT_HEIGHT]
+        ).max()
+
+        # 画像の90%以上を占める場合は「背景ごと検出してしまった」とみなし、クロップしない
+        if (max_x - min_x) > dw * 0.9 and (max_y - min_y) > dh * 0.9:
+            return
+
+        # サムネイル座標をフル解像度に戻す
+        if detect_scale != 1.0:
+            inv_scale = 1.0 / detect_scale
+            min_x = int(min_x * inv_scale)
+            min_y = int(min_y * inv_scale)
+            max_x = min(w, int(max_x * inv_scale))
+            max_y = min(h, int(max_y * inv_scale))
 
         # 検出された幅と高さ
         detect_w = max_x - min_x
         detect_h = max_y - min_y
 
-        # 画像の90%以上を占める場合は「背景ごと検出してしまった」とみなし、クロップしない
-        if detect_w > w * 0.9 and detect_h > h * 0.9:
-            return
-
         # 7. パディング（余白）を追加
         # 顔が見切れないよう、少し多めに余白(15%)を取る
         pad_x = int(detect_w * 0.15)
@@ -155,7 +235,33 @@ class GameEngine:
             and cropped_img.shape[0] > 50
             and cropped_img.shape[1] > 50
         ):
-            self.original_image = cropped_img
+            # スライスは非連続ビューになるため、連続メモリに詰め直して
+            # 以降のフィルタ処理がSIMDの高速パスに乗るようにする
+            self.original_image = np.ascontiguousarray(cropped_img)
+            self._frame_cache.clear()
+
+    def downscale_for_display(self, max_long_edge=1024):
+        """
+        表示に十分なサイズまで画像を一度だけ縮小する
+        GUIの表示解像度を超える画素はぼかし・ズーム処理の無駄なコストになるため、
+        長辺がmax_long_edge以下になるよう縮小し、元解像度は_full_resに保持する
+        """
+        if self.original_image is None:
+            return
+
+        h, w = self.original_image.shape[:2]
+        long_edge = max(h, w)
+        if long_edge <= max_long_edge:
+            return
+
+        self._full_res = self.original_image
+        scale = max_long_edge / long_edge
+        self.original_image = cv2.resize(
+            self.original_image,
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+        self._frame_cache.clear()
 
     def set_answer(self, answer):
         """正解を手動で設定"""
@@ -175,31 +281,41 @@ class GameEngine:
             progress = 1.0
         progress = max(0.0, min(1.0, progress))
 
+        # 量子化した進行度でキャッシュを引く
+        # （0.01刻みなら見た目は変わらず、連続フレームの再計算を省ける）
+        key = (self.mode, round(progress, 2))
+        cached = self._frame_cache.get(key)
+        if cached is not None:
+            self._frame_cache.move_to_end(key)
+            return cached
+
         # 画像処理の適用
         if self.mode == "blur":
-            return self.image_processor.apply_blur(self.original_image, progress)
+            result = self.image_processor.apply_blur(self.original_image, progress)
         elif self.mode == "zoom":
-            return self.image_processor.apply_zoom(self.original_image, progress)
+            result = self.image_processor.apply_zoom(self.original_image, progress)
         elif self.mode == "hybrid":
-            return self.image_processor.apply_hybrid(self.original_image, progress)
+            result = self.image_processor.apply_hybrid(self.original_image, progress)
         else:
-            return self.original_image.copy()
+            # 呼び出し側は表示にしか使わないため、コピーせずそのまま返す
+            result = self.original_image
+
+        self._frame_cache[key] = result
+        if len(self._frame_cache) > self._cache_cap:
+            self._frame_cache.popitem(last=False)
+
+        return result
 
     def check_answer(self, user_answer):
         """回答をチェック"""
         user_answer_norm = user_answer.strip().lower()
         key = self.correct_answer_key
-        
-        # 有効な正解リストを作成
-        valid_answers = set()
-        valid_answers.add(key)  # ファイル名そのものも正解に含める
-
-        # JSON辞書にキーがあれば、そのリストを追加
-        if key in self.synonyms:
-            # リスト内の単語も小文字化・空白除去してセットに追加
-            for synonym in self.synonyms[key]:
-                valid_answers.add(str(synonym).strip().lower())
-        
+
+        # 事前構築済みの正解セットを引く（辞書にないキーはキー自身のみが正解）
+        valid_answers = self._valid_answers.get(key)
+        if valid_answers is None:
+            valid_answers = frozenset((key,))
+
         # 判定: ユーザの回答が正解セットに含まれているか
         is_correct = user_answer_norm in valid_answers
         
@@ -6,13 +6,58 @@ ImageProcessor - 画像処理クラス
 import cv2
 import numpy as np
 
+# cv2.stackBlurはOpenCV 4.7以降で利用可能
+_HAS_STACK_BLUR = hasattr(cv2, "stackBlur")
+
 
 class ImageProcessor:
     """画像プロセッサークラス"""
 
     def __init__(self):
         """初期化"""
-        pass
+        # 進行度(1%刻み) -> ぼかしパラメータ の変換表
+        self._blur_table = self._build_blur_table()
+        # ハイブリッドモードでズーム結果を書き込む使い回しバッファ
+        # （フレームごとのフルサイズ確保を避ける）
+        self._zoom_buf = None
+
+    def _build_blur_table(self, max_sigma=30.0):
+        """
+        進行度1%刻みのぼかしパラメータ表を構築する
+
+        sigma計算・カーネルサイズの奇数調整・アルゴリズム選択の分岐を
+        起動時に済ませておき、毎フレームのapply_blurでは表引きだけにする
+        """
+        table = []
+        for i in range(101):
+            sigma = max_sigma * (1.0 - i / 100.0)
+
+            if sigma <= 0.1:  # ほぼ0なら処理しない
+                table.append(None)
+                continue
+
+            # カーネルサイズをsigmaから計算 (奇数にする必要がある)
+            ksize = int(sigma * 6) + 1
+            if ksize % 2 == 0:
+                ksize += 1
+
+            # 強いぼかしはカーネルサイズに依存しないアルゴリズムで処理する
+            # （序盤のsigma≈30ではガウシアンのカーネルが180タップを超えるため）
+            # stackBlur/boxFilterは整数アキュムレータでuint8のまま処理するので、
+            # ガウシアンの内部FP32変換による帯域コストもかからない
+            if sigma > 4:
+                if _HAS_STACK_BLUR:
+                    table.append(("stack", (ksize, ksize), None))
+                else:
+                    # boxFilterを3回重ねるとガウシアンを近似できる（中心極限定理）
+                    box_ksize = int(sigma * 1.73) | 1
+                    table.append(("box", (box_ksize, box_ksize), None))
+            else:
+                # 弱いぼかしは品質重視で分離可能ガウシアン
+                kernel_1d = cv2.getGaussianKernel(ksize, sigma)
+                table.append(("gauss", ksize, kernel_1d))
+
+        return table
 
     def apply_blur(self, image, progress):
         """
@@ -21,29 +66,35 @@ class ImageProcessor:
         if image is None:
             return None
 
-        # 進行度を 0.0-1.0 にクリップ
+        # 進行度を 0.0-1.0 にクリップし、1%刻みで事前計算表を引く
         progress = max(0.0, min(1.0, progress))
+        entry = self._blur_table[int(progress * 100.0 + 0.5)]
 
-        # 最大ぼかし強度 (sigma)
-        max_sigma = 30.0
+        if entry is None:  # ほぼ0なら処理しない
+            # 呼び出し側は結果を読み取り専用として扱うため、コピーせず返す
+            return image
 
-        # 進行度に応じてsigmaを減少 (1.0のとき0になる)
-        sigma = max_sigma * (1.0 - progress)
+        method, ksize, kernel_1d = entry
 
-        if sigma <= 0.1:  # ほぼ0なら処理しない
-            return image.copy()
+        if method == "stack":
+            # stackBlurは移動和ベースでカーネル幅によらずO(1)/画素
+            return cv2.stackBlur(image, ksize)
 
-        # カーネルサイズをsigmaから計算 (奇数にする必要がある)
-        ksize = int(sigma * 6) + 1
-        if ksize % 2 == 0:
-            ksize += 1
+        if method == "box":
+            result = cv2.boxFilter(image, -1, ksize)
+            result = cv2.boxFilter(result, -1, ksize)
+            return cv2.boxFilter(result, -1, ksize)
 
-        return cv2.GaussianBlur(image, (ksize, ksize), sigma)
+        # 分離可能畳み込み (2次元カーネルのO(k^2)に対して縦横2回のO(k)で済む)
+        return cv2.sepFilter2D(
+            image, -1, kernel_1d, kernel_1d, borderType=cv2.BORDER_REPLICATE
+        )
 
-    def apply_zoom(self, image, progress):
+    def apply_zoom(self, image, progress, out=None):
         """
         progress: 0.0 (開始) -> 1.0 (クリア)
         アフィン変換を使用してサブピクセル精度で滑らかにズームアウト
+        outを指定すると結果をそのバッファに書き込む（確保を省略できる）
         """
         if image is None:
             return None
@@ -65,38 +116,56 @@ class ImageProcessor:
         # スケール係数: current_ratioが小さいほど拡大（ズームイン）、大きいほど縮小（ズームアウト）
         # 目標は元画像の中心部分をcurrent_ratioのサイズで切り出して、元サイズに拡大すること
         scale = 1.0 / current_ratio
-        
-        # アフィン変換行列: 中心を基準に拡大し、出力画像の中心に配置
-        # M = [[scale, 0, tx],
-        #      [0, scale, ty]]
-        # 変換式: dst(x,y) = src(scale*x + tx, scale*y + ty)
-        # 中心(cx, cy)が常に出力画像の中心(width/2, height/2)に対応するように設定
-        tx = (width / 2.0) - (cx * scale)
-        ty = (height / 2.0) - (cy * scale)
-        
-        M = np.array([[scale, 0, tx],
-                      [0, scale, ty]], dtype=np.float32)
+
+        # アフィン変換行列: 中心(cx, cy)を固定点としてscale倍に拡大
+        # M = [[scale, 0, cx*(1-scale)],
+        #      [0, scale, cy*(1-scale)]]
+        M = np.array(
+            [[scale, 0, cx * (1.0 - scale)], [0, scale, cy * (1.0 - scale)]],
+            dtype=np.float32,
+        )
 
         # アフィン変換を適用（サブピクセル精度で滑らかに処理）
-        result = cv2.warpAffine(
-            image, 
-            M, 
-            (width, height), 
-            flags=cv2.INTER_CUBIC,  # より滑らかな補間
+        # バイリニア補間で十分滑らかで、バイキュービックより大幅に軽い
+        if out is not None:
+            cv2.warpAffine(
+                image,
+                M,
+                (width, height),
+                dst=out,
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT,
+                borderValue=(0, 0, 0),  # はみ出した部分は黒で塗りつぶし
+            )
+            return out
+
+        return cv2.warpAffine(
+            image,
+            M,
+            (width, height),
+            flags=cv2.INTER_LINEAR,
             borderMode=cv2.BORDER_CONSTANT,
-            borderValue=(0, 0, 0)  # はみ出した部分は黒で塗りつぶし
+            borderValue=(0, 0, 0),  # はみ出した部分は黒で塗りつぶし
         )
-        
-        return result
 
     def apply_hybrid(self, image, progress):
         # ズームとぼかしを組み合わせる
         # 例: ズームは線形に，ぼかしは後半早めに消えるように調整
-        zoomed = self.apply_zoom(image, progress)
+        # ズームの中間結果は外に返らないため、使い回しバッファに書き込んで
+        # フレームごとの確保を1回分減らす（ぼかしが新しい配列を返す）
+        if self._zoom_buf is None or self._zoom_buf.shape != image.shape:
+            self._zoom_buf = np.empty_like(image)
+        zoomed = self.apply_zoom(image, progress, out=self._zoom_buf)
 
         # ぼかし用の進行度を少し早める (例: progress 0.8でぼかしゼロ)
         blur_progress = min(1.0, progress * 1.25)
-        return self.apply_blur(zoomed, blur_progress)
+        blurred = self.apply_blur(zoomed, blur_progress)
+
+        # ぼかしが無処理で済んだ場合はスクラッチバッファがそのまま返るため、
+        # 外に出す前にコピーして次フレームの上書きから切り離す
+        if blurred is zoomed:
+            return zoomed.copy()
+        return blurred
 
     def resize_image(self, image, target_width, target_height):
         """
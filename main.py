@@ -533,8 +533,8 @@ class GameScreen(QWidget):
         else:
             progress = 1.0
 
-        # プログレスバーで進行度を表示
-        self.progress_bar.update_progress(progress)
+        # プログレスバーで進行度を表示（値域は0.0-1.0で確定している）
+        self.progress_bar.set_fraction(progress)
 
     def display_image(self, image):
         """画像を表示する"""
@@ -548,8 +548,10 @@ class GameScreen(QWidget):
         height, width, channel = image.shape
         bytes_per_line = 3 * width
 
+        # GameEngineはOpenCVネイティブのBGRのまま画像を返すため、
+        # Format_BGR888でコピーなしにそのまま解釈する
         q_image = QImage(
-            image.data, width, height, bytes_per_line, QImage.Format_RGB888
+            image.data, width, height, bytes_per_line, QImage.Format_BGR888
         )
 
         # QPixmapに変換して表示
@@ -684,7 +686,7 @@ class GameScreen(QWidget):
         self.image_label.setText("画像がここに表示されます")
         self.answer_input.clear()
         self.time_label.setText("経過時間：00.0s")
-        self.progress_bar.setValue(0)
+        self.progress_bar.reset()
 
     def reset_game(self):
         """ゲームをリセット"""
@@ -696,7 +698,7 @@ class GameScreen(QWidget):
         self.answer_input.clear()
         self.time_label.setText("経過時間：00.0s")
         self.score_label.setText("スコア：---")
-        self.progress_bar.setValue(0)
+        self.progress_bar.reset()
 
         # セッション情報をリセット
         self.session_is_active = False
@@ -717,8 +719,8 @@ class GameScreen(QWidget):
             QMessageBox.warning(self, "警告", "先にモードを選択してください")
             return
 
-        # データセットからランダムに画像を選択
-        image_path = self.dataset_loader.get_random_image()
+        # データセットから先読み済みのデコード画像を取得
+        image_path, image = self.dataset_loader.get_random_prepared_image()
 
         if image_path is None:
             QMessageBox.warning(
@@ -730,7 +732,12 @@ class GameScreen(QWidget):
             return
 
         # ゲームエンジンの初期化
-        self.game_engine = GameEngine(image_path, self.current_mode)
+        if image is not None:
+            self.game_engine = GameEngine.from_preloaded(
+                image, image_path, self.current_mode
+            )
+        else:
+            self.game_engine = GameEngine(image_path, self.current_mode)
         self.timer_controller.start()
         self.update_display()
         self.update_timer.start(100)  # 100msごとに更新
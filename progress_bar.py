@@ -1,10 +1,42 @@
 from PyQt5.QtWidgets import QProgressBar
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QRect, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
+
 
 class ProgressBar(QProgressBar):
     """
     ゲームの進行状況（画像の鮮明度など）を表示するプログレスバー
+
+    描画はpaintEventで直接行う。QSSスタイルのQProgressBarは毎ペイントで
+    スタイルルールの照合とQStyleOption構築を通るため、2色の単純なバーには
+    矩形2つ＋テキスト1つのQPainter描画のほうが大幅に軽い
     """
+
+    # 追加する属性をスロット化し、更新パスでの属性参照を
+    # 辞書探索ではなく固定オフセットのアクセスにする
+    __slots__ = (
+        "_is_complete",
+        "_pending_value",
+        "_update_scheduled",
+        "_current_color",
+    )
+
+    # 描画に使う色・ペン（インスタンス間で共有できる不変オブジェクト）
+    _COLOR_ACTIVE = QColor("#3498db")
+    _COLOR_DONE = QColor("#2ecc71")
+    _COLOR_BACKGROUND = QColor("#ecf0f1")
+    _PEN_BORDER = QPen(QColor("#bdc3c7"), 2)
+    _FONT_TEXT = QFont()
+    _FONT_TEXT.setBold(True)
+
+    # 進捗値（パーセント）の更新通知
+    # ワーカースレッドから呼ばれた場合もQtが自動でキュー接続にするため、
+    # GUIスレッド以外からの更新が1回のシグナル発行で安全に届く
+    progressChanged = pyqtSignal(int)
+
+    # 256分割で量子化された進捗(n/256)をパーセントへ変換する事前計算表
+    _PCT_FROM_256 = tuple(i * 100 // 256 for i in range(257))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.init_ui()
@@ -13,44 +45,138 @@ class ProgressBar(QProgressBar):
         """UIの初期化"""
         self.setRange(0, 100)
         self.setValue(0)
-        self.setTextVisible(True)
-        self.setAlignment(Qt.AlignCenter)
-        self.setFormat("鮮明度: %p%")
-        
-        # スタイルの設定
-        self.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #ecf0f1;
-                height: 25px;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                width: 10px;
-                margin: 0.5px;
-            }
-        """)
+        self.setMinimumHeight(25)
+        self._current_color = self._COLOR_ACTIVE
+        self._is_complete = False
+
+        # 更新の間引き用の状態
+        # （連続呼び出しをイベントループが空くまで1回にまとめる）
+        self._pending_value = None
+        self._update_scheduled = False
+
+        # 更新はすべてシグナル経由でGUIスレッドの_schedule_updateに集める
+        self.progressChanged.connect(self._schedule_update)
+
+    def set_fraction(self, fraction):
+        """
+        進捗を割合で設定する
+
+        Args:
+            fraction (float): 進捗値 (0.0 - 1.0)
+        """
+        if fraction >= 1.0:
+            percentage = 100
+        elif fraction <= 0.0:
+            percentage = 0
+        else:
+            percentage = int(fraction * 100)
+        self.progressChanged.emit(percentage)
+
+    def set_percent(self, percent):
+        """
+        進捗をパーセントで設定する
+
+        Args:
+            percent (int): 進捗値 (0 - 100)
+        """
+        self.progressChanged.emit(int(percent))
+
+    def set_progress_n_of(self, n, denom=256):
+        """
+        量子化された進捗 n/denom をパーセントで設定する
+
+        画像処理側が整数ステップ（例: 1/256刻み）で進捗を報告する場合、
+        denom=256なら表引きだけで済み、浮動小数点演算を一切行わない
+
+        Args:
+            n (int): 分子 (0 - denom)
+            denom (int): 分母
+        """
+        if denom == 256:
+            self.progressChanged.emit(self._PCT_FROM_256[n])
+        else:
+            self.progressChanged.emit(n * 100 // denom)
 
     def update_progress(self, value):
         """
-        進捗状況を更新する
-        
+        進捗状況を更新する（互換用の振り分けラッパー）
+
+        呼び出し側が値域を知っている場合はset_fraction / set_percentを
+        直接使うことで、毎回の値域判定を省ける
+
         Args:
             value (float): 進捗値 (0.0 - 1.0) または パーセント (0 - 100)
         """
-        # 0.0-1.0の範囲なら100倍する、それ以外はそのまま
-        if 0.0 <= value <= 1.0:
-            percentage = int(value * 100)
+        if value <= 1.0:
+            self.set_fraction(value)
         else:
-            percentage = int(value)
-            
+            self.set_percent(value)
+
+    def reset(self):
+        """
+        バーを初期状態（0%・青・テキスト非表示）へ戻す
+
+        ラウンド開始時の内部的な巻き戻しなので、valueChangedの発行を
+        抑止して接続先スロットへの無駄な通知を避ける
+        """
+        self.blockSignals(True)
+        self.setValue(0)
+        self.blockSignals(False)
+
+        self._pending_value = None
+        self._is_complete = False
+        self._current_color = self._COLOR_ACTIVE
+        self.update()
+
+    def _schedule_update(self, percentage):
+        # 最新値だけを保持し、イベントループが空いたタイミングで1回だけ反映する
+        # （高頻度の呼び出しで描画要求が積み上がるのを防ぐ）
+        self._pending_value = percentage
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self):
+        """溜まっている最新の進捗値を実際にウィジェットへ反映する"""
+        self._update_scheduled = False
+        percentage = self._pending_value
+        if percentage is None:
+            return
+
+        # 値が変わらない呼び出し（開始前の0や完了後の100の連続更新）は
+        # Qt側の値変更・再描画処理ごとスキップする
+        if percentage == self.value():
+            return
+
         self.setValue(percentage)
-        
-        # 進行度に応じて色を変えるなどの演出も可能
-        if percentage >= 100:
-            self.setStyleSheet(self.styleSheet().replace("#3498db", "#2ecc71")) # 緑色に変更
-        else:
-            self.setStyleSheet(self.styleSheet().replace("#2ecc71", "#3498db")) # 青色に戻す
+
+        # 100%をまたいだときだけ色を切り替える（緑⇔青）
+        done = percentage >= 100
+        if done != self._is_complete:
+            self._is_complete = done
+            self._current_color = self._COLOR_DONE if done else self._COLOR_ACTIVE
+
+    def paintEvent(self, event):
+        """背景・進捗・テキストをQPainterで直接描画する"""
+        painter = QPainter(self)
+        rect = self.rect()
+
+        # 背景と枠
+        painter.fillRect(rect, self._COLOR_BACKGROUND)
+        painter.setPen(self._PEN_BORDER)
+        painter.drawRect(rect.adjusted(1, 1, -1, -1))
+
+        # 進捗チャンク（塗りつぶし矩形1つ）
+        value = self.value()
+        fill_width = rect.width() * value // 100
+        if fill_width > 0:
+            painter.fillRect(
+                QRect(rect.x(), rect.y(), fill_width, rect.height()),
+                self._current_color,
+            )
+
+        # テキストのレイアウト計算は重いため、完了時のみ描画する
+        if value >= 100:
+            painter.setFont(self._FONT_TEXT)
+            painter.setPen(Qt.black)
+            painter.drawText(rect, Qt.AlignCenter, "鮮明度: {}%".format(value))